@@ -2,31 +2,32 @@
 import type { BotConfig } from './types.ts';
 
 export class AuthManager {
-  private allowedGroupId: number[];
-  private adminUserIds: number[];
+  // Sets built once, so the per-update checks are constant-time lookups
+  private allowedGroupId: Set<number>;
+  private adminUserIds: Set<number>;
 
   constructor(config: BotConfig) {
-    this.allowedGroupId = config.allowedGroupId;
-    this.adminUserIds = config.adminUserIds;
+    this.allowedGroupId = new Set(config.allowedGroupId);
+    this.adminUserIds = new Set(config.adminUserIds);
   }
 
   isAllowedChat(chatId: number, userId?: number): boolean {
     // Allow admin users from any chat
-    if (userId && this.adminUserIds.includes(userId)) {
+    if (userId && this.adminUserIds.has(userId)) {
       return true;
     }
     // Allow anyone from the specified group
-    return this.allowedGroupId.includes(chatId);
+    return this.allowedGroupId.has(chatId);
   }
 
   isAdmin(userId: number): boolean {
-    return this.adminUserIds.includes(userId);
+    return this.adminUserIds.has(userId);
   }
 
   getAuthInfo(): { allowedGroupId: string; adminCount: number } {
     return {
-      allowedGroupId: this.allowedGroupId.join(', '),
-      adminCount: this.adminUserIds.length,
+      allowedGroupId: [...this.allowedGroupId].join(', '),
+      adminCount: this.adminUserIds.size,
     };
   }
 }
@@ -32,6 +32,7 @@ export class EnBot {
     supabase: SupabaseClient,
     isDevelopment: boolean = false,
     googleSheetsConfig?: GoogleSheetsEnvConfig,
+    readSupabase?: SupabaseClient,
   ) {
     this.config = {
       botToken,
@@ -61,6 +62,7 @@ export class EnBot {
       supabase,
       this.telegram,
       googleSheetsClient,
+      readSupabase,
     );
     this.initializeCommands();
   }
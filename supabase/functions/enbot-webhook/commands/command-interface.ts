@@ -8,6 +8,8 @@ import type {
 import { TelegramClient } from '../telegram-client.ts';
 import { SessionManager } from '../session-manager.ts';
 import type { GoogleSheetsClient } from '../google-sheets-client.ts';
+import { boldMarkdownV2 } from '../utils/markdown-utils.ts';
+import { runInBackground } from '../utils/background-task.ts';
 
 /**
  * Context object containing all the dependencies and current state for command execution
@@ -17,6 +19,11 @@ import type { GoogleSheetsClient } from '../google-sheets-client.ts';
 export interface CommandContext {
   /** Supabase client for database operations */
   supabase: SupabaseClient;
+  /**
+   * Supabase client for reference data that rarely changes (categories).
+   * Points to the read replica when configured, otherwise the same as supabase
+   */
+  readSupabase: SupabaseClient;
   /** Telegram client for sending messages and handling bot operations */
   telegram: TelegramClient;
   /** Session manager for persisting user interaction state */
@@ -60,7 +67,22 @@ export interface CommandSession extends UserSession {
   /** Type/name of the command this session belongs to */
   commandType: string;
   /** Command-specific data collected during the interaction flow */
-  commandData: Record<string, unknown>;
+  commandData: CommandData;
+}
+
+/**
+ * Command-specific state kept in a session
+ *
+ * Persisted together with the transaction data, so it shares its storage
+ * (e.g. `category` is the category name set on transactionData).
+ */
+export interface CommandData {
+  /** ID of the category selected in the category step */
+  categoryId?: number;
+  /** Name of the selected category */
+  category?: string;
+  /** Whether the person name step is collecting a new contact name */
+  isNewContactMode?: boolean;
 }
 
 /**
@@ -529,6 +551,47 @@ export abstract class BaseCommand implements Command {
       return { success: false, error: errorMessage };
     }
   }
+  /**
+   * Synchronize transaction with Google Sheets in the background
+   *
+   * The transaction is already saved in the database at this point, so the
+   * completion notification does not need to wait for the Google Sheets round
+   * trips. If the sync fails (and Google Sheets is configured) the given
+   * message is sent to the chat once the sync settles.
+   *
+   * @param transactionId - Database ID of the transaction to sync
+   * @param failureMessage - MarkdownV2 message sent when the sync fails
+   * @protected
+   */
+  protected syncTransactionInBackground(
+    transactionId: number,
+    failureMessage: string,
+  ): void {
+    const syncTask = async (): Promise<void> => {
+      const syncResult = await this.syncTransactionToGoogleSheets(
+        transactionId,
+      );
+      if (!syncResult.success) {
+        console.warn(
+          `⚠️ Failed to sync transaction ${transactionId} to Google Sheets: ${syncResult.error}`,
+        );
+        // Only show error message if it's not a configuration issue
+        if (!syncResult.error?.includes('not configured')) {
+          await this.sendMessage(failureMessage, { parse_mode: 'MarkdownV2' });
+        }
+      } else {
+        console.log(
+          `✅ Transaction ${transactionId} synced to Google Sheets successfully`,
+        );
+      }
+    };
+
+    runInBackground(
+      syncTask(),
+      `Google Sheets sync for transaction ${transactionId}`,
+    );
+  }
+
   /**
    * Convert command session data to transaction payload format
    *
@@ -557,6 +620,37 @@ export abstract class BaseCommand implements Command {
     };
   }
 
+  /**
+   * Format the notification sent when a transaction is completed
+   *
+   * Wraps the command-specific summary with the parts every transaction
+   * notification shares: title, optional description and recorder footer.
+   *
+   * @param title - Notification title (plain text, escaped here)
+   * @param summary - Command-specific summary, already escaped for MarkdownV2
+   * @param transactionPayload - Payload built by getTransactionPayload
+   * @returns Notification text ready to send with MarkdownV2 parse mode
+   * @protected
+   */
+  protected formatTransactionNotification(
+    title: string,
+    summary: string,
+    transactionPayload: Record<string, unknown>,
+  ): string {
+    const recordedBy = transactionPayload.recorded_by as string;
+    const description = transactionPayload.description as string;
+
+    return `🔔  ${boldMarkdownV2(title)}\n\n` +
+      `${summary}\n\n` +
+      (description && description.trim()
+        ? `📝 ${boldMarkdownV2('Descrizione')}: ${
+          boldMarkdownV2(description)
+        }\n\n`
+        : '') +
+      `Registrato da: ${boldMarkdownV2(recordedBy)}\n\n` +
+      `Grazie da EnB`;
+  }
+
   /**
    * Determine if this command can handle the given message
    *
@@ -872,25 +966,23 @@ export abstract class BaseCommand implements Command {
         ? messages.filter((msg) => !msg.is_last_message)
         : messages;
 
-      // Delete messages from Telegram
-      let telegramDeleted = 0;
-      let telegramFailed = 0;
-
-      if (messagesToDelete.length > 0) {
-        const messageIds = messagesToDelete.map((msg) => msg.message_id);
-        const result = await this.context.telegram.deleteMessages(
-          this.context.chatId,
-          messageIds,
-        );
-        telegramDeleted = result.deleted;
-        telegramFailed = result.failed;
-      }
-
-      // Clean up from database
-      const dbResult = await this.context.sessionManager.cleanupSessionMessages(
-        sessionId,
-        preserveLast,
-      );
+      // Delete messages from Telegram and clean up the database concurrently,
+      // the message list has already been read
+      const messageIds = messagesToDelete.map((msg) => msg.message_id);
+      const [telegramResult, dbResult] = await Promise.all([
+        messageIds.length > 0
+          ? this.context.telegram.deleteMessages(
+            this.context.chatId,
+            messageIds,
+          )
+          : Promise.resolve({ deleted: 0, failed: 0 }),
+        this.context.sessionManager.cleanupSessionMessages(
+          sessionId,
+          preserveLast,
+        ),
+      ]);
+      const telegramDeleted = telegramResult.deleted;
+      const telegramFailed = telegramResult.failed;
 
       console.log(
         `🧹 Message cleanup completed: ${dbResult.deleted} DB deleted, ${dbResult.preserved} preserved, ${telegramDeleted} Telegram deleted, ${telegramFailed} Telegram failed`,
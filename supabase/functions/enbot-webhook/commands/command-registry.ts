@@ -17,6 +17,7 @@ export class CommandRegistry {
     CommandStatic
   > = new Map();
   private supabase: SupabaseClient;
+  private readSupabase: SupabaseClient;
   private telegram: TelegramClient;
   private sessionManager: SessionManager;
   private googleSheetsClient?: GoogleSheetsClient;
@@ -25,8 +26,10 @@ export class CommandRegistry {
     supabase: SupabaseClient,
     telegram: TelegramClient,
     googleSheetsClient?: GoogleSheetsClient,
+    readSupabase?: SupabaseClient,
   ) {
     this.supabase = supabase;
+    this.readSupabase = readSupabase || supabase;
     this.telegram = telegram;
     this.sessionManager = new SessionManager(supabase);
     this.googleSheetsClient = googleSheetsClient;
@@ -80,6 +83,7 @@ export class CommandRegistry {
 
     return {
       supabase: this.supabase,
+      readSupabase: this.readSupabase,
       telegram: this.telegram,
       sessionManager: this.sessionManager,
       googleSheetsClient: this.googleSheetsClient,
@@ -224,7 +224,7 @@ export class CreditNoteCommand extends BaseCommand {
         const categoryId = result.processedValue;
 
         // Fetch category name from database
-        const { data: category, error } = await this.context.supabase
+        const { data: category, error } = await this.context.readSupabase
           .from('categories')
           .select('name')
           .eq('id', categoryId)
@@ -383,7 +383,7 @@ export class CreditNoteCommand extends BaseCommand {
 
       // Get required roles for the current command and category
       const commandType = stepContext.session.commandType;
-      const categoryName = stepContext.session.commandData?.category as string;
+      const categoryName = stepContext.session.commandData?.category;
       const requiredRoles = getRequiredRoles(commandType, categoryName);
 
       const saved = await saveNewContact(
@@ -623,38 +623,23 @@ export class CreditNoteCommand extends BaseCommand {
         return { success: false, message: 'Database error' };
       }
 
-      // Delete session after successful completion with message cleanup
-      // Preserve the last notification message
-      await this.deleteSessionWithCleanup(true, true);
-
       const transactionId = _data.id;
 
-      // Sync with Google Sheets (optional)
-      const syncResult = await this.syncTransactionToGoogleSheets(
+      // Sync with Google Sheets (optional) without delaying the notification
+      this.syncTransactionInBackground(
         transactionId,
+        escapeMarkdownV2(
+          `⚠️ Nota di credito salvata ma sincronizzazione con Google Sheets fallita.
+         Verrà ritentata automaticamente.`,
+        ),
       );
-      if (!syncResult.success) {
-        console.warn(
-          `⚠️ Failed to sync transaction ${transactionId} to Google Sheets: ${syncResult.error}`,
-        );
-        // Only show error message if it's not a configuration issue
-        if (!syncResult.error?.includes('not configured')) {
-          await this.sendMessage(
-            escapeMarkdownV2(
-              `⚠️ Nota di credito salvata ma sincronizzazione con Google Sheets fallita.
-             Verrà ritentata automaticamente.`,
-            ),
-            { parse_mode: 'MarkdownV2' },
-          );
-        }
-      } else {
-        console.log(
-          `✅ Transaction ${transactionId} synced to Google Sheets successfully`,
-        );
-      }
 
-      // Send notification message
-      await this.sendCreditNoteNotification(transactionPayload, transactionId);
+      // Clean up the session messages and send the notification concurrently,
+      // the notification is marked as last message so cleanup preserves it
+      await Promise.all([
+        this.deleteSessionWithCleanup(true, true),
+        this.sendCreditNoteNotification(transactionPayload, transactionId),
+      ]);
 
       return {
         success: true,
@@ -800,25 +785,16 @@ export class CreditNoteCommand extends BaseCommand {
   ): Promise<void> {
     const categoryName = transactionPayload.category as string;
     const familyName = transactionPayload.family as string;
-    const recordedBy = transactionPayload.recorded_by as string;
-    const description = transactionPayload.description as string;
-
-    const notificationMessage =
-      `🔔  ${boldMarkdownV2('Nota di Credito Registrata')}\n\n` +
-      `📄 ${boldMarkdownV2('Categoria')}: ${
-        boldMarkdownV2(escapeMarkdownV2(categoryName))
-      }\n` +
-      `👤 ${boldMarkdownV2('Persona')}: ${boldMarkdownV2(familyName)}\n` +
-      `💰 ${boldMarkdownV2('Importo')}: ${
-        formatCurrencyMarkdownV2(transactionPayload.amount as number)
-      }\n` +
-      (description && description.trim()
-        ? `📝 ${boldMarkdownV2('Descrizione')}: ${
-          boldMarkdownV2(escapeMarkdownV2(description))
-        }\n\n`
-        : '') +
-      `\nRegistrato da: ${boldMarkdownV2(recordedBy)}\n\n` +
-      `Grazie da EnB`;
+
+    const notificationMessage = this.formatTransactionNotification(
+      'Nota di Credito Registrata',
+      `📄 ${boldMarkdownV2('Categoria')}: ${boldMarkdownV2(categoryName)}\n` +
+        `👤 ${boldMarkdownV2('Persona')}: ${boldMarkdownV2(familyName)}\n` +
+        `💰 ${boldMarkdownV2('Importo')}: ${
+          formatCurrencyMarkdownV2(transactionPayload.amount as number)
+        }`,
+      transactionPayload,
+    );
 
     // Send confirmation message to the chat where the command was issued
     // Mark this as the last message to preserve during cleanup
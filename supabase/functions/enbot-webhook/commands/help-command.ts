@@ -5,47 +5,45 @@ import {
   type CommandResult,
 } from './command-interface.ts';
 import type { TelegramMessage } from '../types.ts';
-import { escapeMarkdownV2 } from '../utils/markdown-utils.ts';
 
-export class HelpCommand extends BaseCommand {
-  static commandName = 'help';
-  static description = '❓ Mostra la guida dei comandi';
-  constructor(context: CommandContext) {
-    super(context, HelpCommand.commandName);
-  }
-
-  override async execute(): Promise<CommandResult> {
-    const helpMessage = `
-🤖 **EnBot \\- Gestione Transazioni**
+// The help text is static, so it is kept as a pre-escaped MarkdownV2 string
+const HELP_MESSAGE = `
+🤖 *EnBot \\- Gestione Transazioni*
 
-**Comandi disponibili:**
+*Comandi disponibili:*
 • /entrata \\- 💰 Registra una nuova entrata
 • /uscita \\- 💸 Registra una nuova uscita
 • /notacredito \\- 📄 Registra una nota di credito
 • /help \\- ❓ Mostra questo messaggio di aiuto
 
-${
-      escapeMarkdownV2(`**Come utilizzare:**
-1. Usa uno dei comandi per registrare una transazione
-2. Seleziona la categoria appropriata
-3. Segui le istruzioni per inserire i dati richiesti
-4. Completa tutti i passaggi richiesti
+*Come utilizzare:*
+1\\. Usa uno dei comandi per registrare una transazione
+2\\. Seleziona la categoria appropriata
+3\\. Segui le istruzioni per inserire i dati richiesti
+4\\. Completa tutti i passaggi richiesti
 
-**Tipi di transazioni:**
-• **Entrate**: Quote mensili, esami, iscrizioni, eventi, depositi, altro
-• **Uscite**: Cambusa, circolo, legna, manutenzione, stipendi, rimborsi, altro
-• **Note di credito**: Stipendi, cambusa, materiale didattico, manutenzione, utenze, altro
+*Tipi di transazioni:*
+• *Entrate*: Quote mensili, esami, iscrizioni, eventi, depositi, altro
+• *Uscite*: Cambusa, circolo, legna, manutenzione, stipendi, rimborsi, altro
+• *Note di credito*: Stipendi, cambusa, materiale didattico, manutenzione, utenze, altro
 
-**Flussi speciali:**
-• **Entrate**: Descrizione opzionale per "Eventi" e "Altro"
-• **Uscite**: Nome persona per "Stipendi contributi" e "Rimborsi"
-• **Note di credito**: Descrizione per "Spese Varie"
+*Flussi speciali:*
+• *Entrate*: Descrizione opzionale per "Eventi" e "Altro"
+• *Uscite*: Nome persona per "Stipendi contributi" e "Rimborsi"
+• *Note di credito*: Descrizione per "Spese Varie"
 
-🔒 **Sicurezza:**
-Questo bot può essere utilizzato solo nel gruppo autorizzato.`)
-    }`;
+🔒 *Sicurezza:*
+Questo bot può essere utilizzato solo nel gruppo autorizzato\\.`;
 
-    await this.sendMessage(helpMessage, { parse_mode: 'MarkdownV2' });
+export class HelpCommand extends BaseCommand {
+  static commandName = 'help';
+  static description = '❓ Mostra la guida dei comandi';
+  constructor(context: CommandContext) {
+    super(context, HelpCommand.commandName);
+  }
+
+  override async execute(): Promise<CommandResult> {
+    await this.sendMessage(HELP_MESSAGE, { parse_mode: 'MarkdownV2' });
 
     return { success: true, message: 'Help displayed' };
   }
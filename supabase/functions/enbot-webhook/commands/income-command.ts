@@ -213,7 +213,7 @@ export class IncomeCommand extends BaseCommand {
         const categoryId = result.processedValue;
 
         // Fetch category name from database
-        const { data: category, error } = await this.context.supabase
+        const { data: category, error } = await this.context.readSupabase
           .from('categories')
           .select('name')
           .eq('id', categoryId)
@@ -312,8 +312,7 @@ export class IncomeCommand extends BaseCommand {
 
         // Get required roles for the current command and category
         const commandType = stepContext.session.commandType;
-        const categoryName = stepContext.session.commandData
-          ?.category as string;
+        const categoryName = stepContext.session.commandData?.category;
         const requiredRoles = getRequiredRoles(commandType, categoryName);
 
         const saved = await saveNewContact(
@@ -742,37 +741,23 @@ export class IncomeCommand extends BaseCommand {
         return { success: false, message: 'Database error' };
       }
 
-      // Delete session after successful completion with message cleanup
-      // Preserve the last notification message
-      await this.deleteSessionWithCleanup(true, true);
-
       const transactionId = data.id;
 
-      // Sync with Google Sheets (optional)
-      const syncResult = await this.syncTransactionToGoogleSheets(
+      // Sync with Google Sheets (optional) without delaying the notification
+      this.syncTransactionInBackground(
         transactionId,
+        escapeMarkdownV2(
+          `⚠️ Entrata salvata ma sincronizzazione con Google Sheets fallita.
+         Verrà ritentata automaticamente.`,
+        ),
       );
-      if (!syncResult.success) {
-        console.warn(
-          `⚠️ Failed to sync transaction ${transactionId} to Google Sheets: ${syncResult.error}`,
-        );
-        // Only show error message if it's not a configuration issue
-        if (!syncResult.error?.includes('not configured')) {
-          await this.sendMessage(
-            escapeMarkdownV2(
-              `⚠️ Entrata salvata ma sincronizzazione con Google Sheets fallita.
-             Verrà ritentata automaticamente.`,
-            ),
-            { parse_mode: 'MarkdownV2' },
-          );
-        }
-      } else {
-        console.log(
-          `✅ Transaction ${transactionId} synced to Google Sheets successfully`,
-        );
-      }
 
-      await this.sendNotification(transactionPayload, transactionId);
+      // Clean up the session messages and send the notification concurrently,
+      // the notification is marked as last message so cleanup preserves it
+      await Promise.all([
+        this.deleteSessionWithCleanup(true, true),
+        this.sendNotification(transactionPayload, transactionId),
+      ]);
 
       return { success: true, message: 'Income completed successfully' };
     } catch (error) {
@@ -883,25 +868,16 @@ export class IncomeCommand extends BaseCommand {
       getMonthByNumber(transactionPayload.month as string)?.full || '';
     const categoryName = transactionPayload.category as string;
     const familyName = transactionPayload.family as string;
-    const recordedBy = transactionPayload.recorded_by as string;
-    const description = transactionPayload.description as string;
 
-    const notificationMessage =
-      `🔔  ${boldMarkdownV2('Entrata Registrata')}\n\n` +
+    const notificationMessage = this.formatTransactionNotification(
+      'Entrata Registrata',
       `Ricevuti *${
         formatCurrencyMarkdownV2(transactionPayload.amount as number)
-      }* per ${boldMarkdownV2(escapeMarkdownV2(categoryName))} di ${
-        boldMarkdownV2(monthName)
-      } ${boldMarkdownV2(transactionPayload.year as string)} da ${
-        boldMarkdownV2(familyName)
-      }\n\n` +
-      (description && description.trim()
-        ? `📝 ${boldMarkdownV2('Descrizione')}: ${
-          boldMarkdownV2(escapeMarkdownV2(description))
-        }\n\n`
-        : '') +
-      `Registrato da: ${boldMarkdownV2(recordedBy)}\n\n` +
-      `Grazie da EnB`;
+      }* per ${boldMarkdownV2(categoryName)} di ${boldMarkdownV2(monthName)} ${
+        boldMarkdownV2(transactionPayload.year as string)
+      } da ${boldMarkdownV2(familyName)}`,
+      transactionPayload,
+    );
 
     // Send confirmation message to the chat where the command was issued
     // Mark this as the last message to preserve during cleanup
@@ -214,7 +214,7 @@ export class OutcomeCommand extends BaseCommand {
         const categoryId = result.processedValue;
 
         // Fetch category name from database
-        const { data: category, error } = await this.context.supabase
+        const { data: category, error } = await this.context.readSupabase
           .from('categories')
           .select('name')
           .eq('id', categoryId)
@@ -324,8 +324,7 @@ export class OutcomeCommand extends BaseCommand {
 
         // Get required roles for the current command and category
         const commandType = stepContext.session.commandType;
-        const categoryName = stepContext.session.commandData
-          ?.category as string;
+        const categoryName = stepContext.session.commandData?.category;
         const requiredRoles = getRequiredRoles(commandType, categoryName);
 
         const saved = await saveNewContact(
@@ -745,38 +744,24 @@ export class OutcomeCommand extends BaseCommand {
         return { success: false, message: 'Database error' };
       }
 
-      // Delete session after successful completion with message cleanup
-      // Preserve the last notification message
-      await this.deleteSessionWithCleanup(true, true);
-
       const transactionId = data.id;
 
-      // Sync with Google Sheets (optional)
-      const syncResult = await this.syncTransactionToGoogleSheets(
+      // Sync with Google Sheets (optional) without delaying the notification
+      this.syncTransactionInBackground(
         transactionId,
+        `⚠️ Uscita salvata ma sincronizzazione con Google Sheets fallita${
+          escapeMarkdownV2('.')
+        }${escapeMarkdownV2('.')}. Verrà ritentata automaticamente${
+          escapeMarkdownV2('.')
+        }.`,
       );
-      if (!syncResult.success) {
-        console.warn(
-          `⚠️ Failed to sync transaction ${transactionId} to Google Sheets: ${syncResult.error}`,
-        );
-        // Only show error message if it's not a configuration issue
-        if (!syncResult.error?.includes('not configured')) {
-          await this.sendMessage(
-            `⚠️ Uscita salvata ma sincronizzazione con Google Sheets fallita${
-              escapeMarkdownV2('.')
-            }${escapeMarkdownV2('.')}. Verrà ritentata automaticamente${
-              escapeMarkdownV2('.')
-            }.`,
-            { parse_mode: 'MarkdownV2' },
-          );
-        }
-      } else {
-        console.log(
-          `✅ Transaction ${transactionId} synced to Google Sheets successfully`,
-        );
-      }
 
-      await this.sendNotification(transactionPayload, transactionId);
+      // Clean up the session messages and send the notification concurrently,
+      // the notification is marked as last message so cleanup preserves it
+      await Promise.all([
+        this.deleteSessionWithCleanup(true, true),
+        this.sendNotification(transactionPayload, transactionId),
+      ]);
 
       return { success: true, message: 'Outcome completed successfully' };
     } catch (error) {
@@ -887,25 +872,16 @@ export class OutcomeCommand extends BaseCommand {
       getMonthByNumber(transactionPayload.month as string)?.full || '';
     const categoryName = transactionPayload.category as string;
     const familyName = transactionPayload.family as string;
-    const recordedBy = transactionPayload.recorded_by as string;
-    const description = transactionPayload.description as string;
 
-    const notificationMessage =
-      `🔔  ${boldMarkdownV2('Uscita Registrata')}\n\n` +
+    const notificationMessage = this.formatTransactionNotification(
+      'Uscita Registrata',
       `Spesi *${
         formatCurrencyMarkdownV2(transactionPayload.amount as number)
-      }* per ${boldMarkdownV2(escapeMarkdownV2(categoryName))} di ${
-        boldMarkdownV2(monthName)
-      } ${boldMarkdownV2(transactionPayload.year as string)}${
-        familyName ? ` da ${boldMarkdownV2(familyName)}` : ''
-      }\n\n` +
-      (description && description.trim()
-        ? `📝 ${boldMarkdownV2('Descrizione')}: ${
-          boldMarkdownV2(escapeMarkdownV2(description))
-        }\n\n`
-        : '') +
-      `Registrato da: ${boldMarkdownV2(recordedBy)}\n\n` +
-      `Grazie da EnB`;
+      }* per ${boldMarkdownV2(categoryName)} di ${boldMarkdownV2(monthName)} ${
+        boldMarkdownV2(transactionPayload.year as string)
+      }${familyName ? ` da ${boldMarkdownV2(familyName)}` : ''}`,
+      transactionPayload,
+    );
 
     // Send confirmation message to the chat where the command was issued
     // Mark this as the last message to preserve during cleanup
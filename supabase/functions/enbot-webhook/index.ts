@@ -8,6 +8,12 @@ const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
 const supabaseKey = Deno.env.get('API_KEY')!;
 const supabase = createClient(supabaseUrl, supabaseKey);
 
+// Optional read replica for reference data reads, falls back to the primary
+const supabaseReadReplicaUrl = Deno.env.get('SUPABASE_READ_REPLICA_URL');
+const readSupabase = supabaseReadReplicaUrl
+  ? createClient(supabaseReadReplicaUrl, supabaseKey)
+  : supabase;
+
 // Bot configuration
 const botToken = Deno.env.get('TELEGRAM_BOT_TOKEN')!;
 const allowedGroupIds =
@@ -34,6 +40,7 @@ const bot = new EnBot(
   supabase,
   false, // isDevelopment
   googleSheetsConfig,
+  readSupabase,
 );
 
 Deno.serve(async (req: Request) => {
@@ -68,6 +75,7 @@ Deno.serve(async (req: Request) => {
           has_group_id: !!allowedGroupIds.length,
           has_supabase_url: !!supabaseUrl,
           has_supabase_key: !!supabaseKey,
+          has_read_replica: !!supabaseReadReplicaUrl,
           google_sheets: {
             has_service_account_key: !!googleSheetsConfig
               .GOOGLE_SERVICE_ACCOUNT_KEY,
@@ -88,6 +96,10 @@ Deno.serve(async (req: Request) => {
       const update = await req.json();
       console.log('📨 Received webhook update:', update.update_id);
 
+      // Answer only once the update is processed, so Telegram paces updates
+      // from the same chat and redelivers an update if the function dies
+      // before answering. Slow follow-up work (Google Sheets sync) already
+      // runs in the background
       await bot.processUpdate(update);
 
       return new Response(JSON.stringify({ status: 'ok' }), {
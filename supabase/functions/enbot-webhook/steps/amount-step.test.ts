@@ -0,0 +1,37 @@
+import { assertEquals } from 'https://deno.land/std@0.208.0/assert/mod.ts';
+import { amountStep } from './amount-step.ts';
+import type { StepContext } from './step-types.ts';
+
+// The amount validator does not use the step context
+const context = {} as StepContext;
+
+Deno.test('amountStep - accepts both decimal separators', () => {
+  assertEquals(amountStep.processInput('25', context).processedValue, 25);
+  assertEquals(amountStep.processInput('25.50', context).processedValue, 25.5);
+  assertEquals(amountStep.processInput('25,50', context).processedValue, 25.5);
+  assertEquals(amountStep.processInput(' 7,5 ', context).processedValue, 7.5);
+  assertEquals(amountStep.processInput('.50', context).processedValue, 0.5);
+  assertEquals(amountStep.processInput('25.', context).processedValue, 25);
+});
+
+Deno.test('amountStep - rejects malformed input', () => {
+  assertEquals(amountStep.processInput('25abc', context).success, false);
+  assertEquals(amountStep.processInput('abc', context).success, false);
+  assertEquals(amountStep.processInput('25.505', context).success, false);
+  assertEquals(amountStep.processInput('1.000,50', context).success, false);
+  assertEquals(amountStep.processInput('-5', context).success, false);
+  assertEquals(amountStep.processInput('', context).success, false);
+  assertEquals(amountStep.processInput('.', context).success, false);
+});
+
+Deno.test('amountStep - enforces the amount range', () => {
+  assertEquals(
+    amountStep.processInput('0', context).error,
+    "❌ L'importo deve essere maggiore di zero",
+  );
+  assertEquals(
+    amountStep.processInput('10000.01', context).error,
+    "❌ L'importo è troppo elevato (massimo €10.000)",
+  );
+  assertEquals(amountStep.processInput('10000', context).success, true);
+});
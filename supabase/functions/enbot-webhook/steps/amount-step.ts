@@ -14,22 +14,28 @@ import {
   formatCurrencyMarkdownV2,
 } from '../utils/markdown-utils.ts';
 
+// Euros with optional cents, using either decimal separator. Like parseFloat,
+// either side of the separator may be empty ('25.' or '.50'), not both
+const AMOUNT_PATTERN = /^(\d+([.,]\d{0,2})?|[.,]\d{1,2})$/;
+
 /**
  * Pure function to validate amount input
  */
 const validateAmount: InputValidator<number> = (input: string) => {
-  // Remove whitespace and normalize decimal separator
-  const cleanInput = input.trim().replace(',', '.');
-
-  const amount = parseFloat(cleanInput);
+  // Remove whitespace before checking the format
+  const cleanInput = input.trim();
 
-  if (isNaN(amount)) {
+  // Reject malformed input up front, parseFloat alone accepts '25abc'
+  if (!AMOUNT_PATTERN.test(cleanInput)) {
     return {
       valid: false,
       error: '❌ Inserisci un numero valido (es. 25.50 o 25,50)',
     };
   }
 
+  // Normalize decimal separator
+  const amount = parseFloat(cleanInput.replace(',', '.'));
+
   if (amount <= 0) {
     return {
       valid: false,
@@ -30,15 +30,23 @@ export interface CategoryType {
   description?: string;
 }
 
+// Category type IDs never change at runtime, so they are resolved once per
+// function instance instead of on every keyboard render
+const categoryTypeIds = new Map<string, number>();
+
 /**
- * Fetch categories from database by type
+ * Get the category type ID, querying the database only on first use
  */
-async function fetchCategoriesByType(
+async function getCategoryTypeId(
   // deno-lint-ignore no-explicit-any
   supabase: any,
   type: 'income' | 'outcome' | 'creditNote',
-): Promise<Category[]> {
-  // First get the category type ID
+): Promise<number | null> {
+  const cachedId = categoryTypeIds.get(type);
+  if (cachedId !== undefined) {
+    return cachedId;
+  }
+
   const { data: typeData, error: typeError } = await supabase
     .from('category_types')
     .select('id')
@@ -47,6 +55,24 @@ async function fetchCategoriesByType(
 
   if (typeError || !typeData) {
     console.error('Error fetching category type:', typeError);
+    return null;
+  }
+
+  categoryTypeIds.set(type, typeData.id);
+  return typeData.id;
+}
+
+/**
+ * Fetch categories from database by type
+ */
+async function fetchCategoriesByType(
+  // deno-lint-ignore no-explicit-any
+  supabase: any,
+  type: 'income' | 'outcome' | 'creditNote',
+): Promise<Category[]> {
+  // First get the category type ID
+  const categoryTypeId = await getCategoryTypeId(supabase, type);
+  if (categoryTypeId === null) {
     return [];
   }
 
@@ -59,7 +85,7 @@ async function fetchCategoriesByType(
         id, name, label, description, is_active
       )
     `)
-    .eq('category_type_id', typeData.id)
+    .eq('category_type_id', categoryTypeId)
     .eq('categories.is_active', true)
     .order('sort_order', { ascending: true });
 
@@ -178,7 +204,7 @@ const createCategoryInputPresenter = (
 ): InputPresenter => {
   return async (context: StepContext): Promise<StepContent> => {
     const categories = await fetchCategoriesByType(
-      context.supabase,
+      context.readSupabase,
       categoryType,
     );
 
@@ -277,7 +303,7 @@ export const createCategoryUpdatePresenter = (
         const pageNumber = parsed.value;
 
         const categories = await fetchCategoriesByType(
-          context.supabase,
+          context.readSupabase,
           categoryType,
         );
         const { keyboard } = createCategoryKeyboard(
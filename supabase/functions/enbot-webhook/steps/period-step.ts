@@ -49,10 +49,14 @@ function parseStateFromCallback(
 /**
  * Create inline keyboard for period selection
  */
-function createPeriodKeyboard(selectedMonth?: string, selectedYear?: string) {
+function createPeriodKeyboard(
+  selectedMonth?: string,
+  selectedYear?: string,
+  now: Date = new Date(),
+) {
   const keyboard = [];
-  const arrangedMonths = getMonthsArrangement();
-  const years = getYearsArrangement();
+  const arrangedMonths = getMonthsArrangement(now);
+  const years = getYearsArrangement(now);
 
   // Month rows (3 rows of 4 months each)
   for (let i = 0; i < arrangedMonths.length; i += 4) {
@@ -89,6 +93,9 @@ function createPeriodKeyboard(selectedMonth?: string, selectedYear?: string) {
   return keyboard;
 }
 
+// Final period value built from the keyboard selections (MM-YYYY)
+const PERIOD_PATTERN = /^\d{2}-\d{4}$/;
+
 /**
  * Simple validation for callback data (inline keyboard is controlled)
  */
@@ -97,7 +104,7 @@ export const validatePeriod: InputValidator<string> = (
 ) => {
   // For inline keyboards, we control the buttons, so validation is minimal
   // Check if it's a valid period format (MM-YYYY) - this means both month and year were selected
-  if (callbackData.includes('-') && callbackData.match(/^\d{2}-\d{4}$/)) {
+  if (PERIOD_PATTERN.test(callbackData)) {
     return { valid: true, value: callbackData };
   }
 
@@ -111,8 +118,11 @@ export const validatePeriod: InputValidator<string> = (
 const presentPeriodInput: InputPresenter = (
   context: StepContext,
 ): StepContent => {
+  // Read the clock once, so the keyboard and the text agree on the current month
+  const now = new Date();
+
   // Start with no selections
-  const keyboard = createPeriodKeyboard();
+  const keyboard = createPeriodKeyboard(undefined, undefined, now);
 
   const options = {
     reply_markup: {
@@ -121,8 +131,8 @@ const presentPeriodInput: InputPresenter = (
     parse_mode: 'MarkdownV2',
   };
 
-  const currentYear = getCurrentYear();
-  const currentMonthName = getCurrentMonthName();
+  const currentYear = getCurrentYear(now);
+  const currentMonthName = getCurrentMonthName(now);
 
   const text = getMessageTitle(context) +
     `🗓️ ${boldMarkdownV2('Mese corrente')}: ${
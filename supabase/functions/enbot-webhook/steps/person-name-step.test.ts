@@ -0,0 +1,76 @@
+import { assertEquals } from 'https://deno.land/std@0.208.0/assert/mod.ts';
+import { personNameStep, validatePersonName } from './person-name-step.ts';
+import type { StepContext } from './step-types.ts';
+import type { TelegramCallbackQuery } from '../types.ts';
+
+// Contact selection callbacks do not use the step context
+const context = {} as StepContext;
+
+function contactCallback(
+  data: string,
+  message?: Record<string, unknown>,
+): TelegramCallbackQuery {
+  return { id: '1', data, message } as unknown as TelegramCallbackQuery;
+}
+
+const contactsMessage = {
+  message_id: 10,
+  reply_markup: {
+    inline_keyboard: [
+      [
+        { text: 'Mario Rossi', callback_data: 'contact:select:7' },
+        { text: 'Anna Bianchi', callback_data: 'contact:select:12' },
+      ],
+      [{ text: '➕ Nuovo contatto', callback_data: 'contact:new' }],
+    ],
+  },
+};
+
+Deno.test('validatePersonName - normalizes whitespace', () => {
+  assertEquals(validatePersonName('  Mario   Rossi '), {
+    valid: true,
+    value: 'Mario Rossi',
+  });
+  assertEquals(validatePersonName("Anna & D'Amico-Bianchi").valid, true);
+});
+
+Deno.test('validatePersonName - rejects invalid names', () => {
+  assertEquals(validatePersonName('   ').valid, false);
+  assertEquals(validatePersonName('M').valid, false);
+  assertEquals(validatePersonName('Mario99').valid, false);
+  assertEquals(validatePersonName("- & '").valid, false);
+});
+
+Deno.test('personNameStep - reads the selected contact from the keyboard', async () => {
+  const result = await personNameStep.processCallback(
+    contactCallback('contact:select:12', contactsMessage),
+    context,
+  );
+  assertEquals(result, { success: true, processedValue: 'Anna Bianchi' });
+});
+
+Deno.test('personNameStep - accepts legacy name selections', async () => {
+  const result = await personNameStep.processCallback(
+    contactCallback('contact:select:Mario Rossi'),
+    context,
+  );
+  assertEquals(result, { success: true, processedValue: 'Mario Rossi' });
+});
+
+Deno.test('personNameStep - rejects IDs that cannot be resolved', async () => {
+  // Inaccessible messages carry no keyboard
+  const inaccessible = await personNameStep.processCallback(
+    contactCallback('contact:select:12', { message_id: 10, date: 0 }),
+    context,
+  );
+  assertEquals(inaccessible, {
+    success: false,
+    error: 'Selezione non valida',
+  });
+
+  const unknownId = await personNameStep.processCallback(
+    contactCallback('contact:select:99', contactsMessage),
+    context,
+  );
+  assertEquals(unknownId.success, false);
+});
@@ -135,7 +135,7 @@ async function loadContacts(
   try {
     // Get command and category from session
     const commandType = context.session.commandType;
-    const categoryName = context.session.commandData?.category as string;
+    const categoryName = context.session.commandData?.category;
 
     // Determine required roles based on command and category
     const requiredRoles = getRequiredRoles(commandType, categoryName);
@@ -228,7 +228,8 @@ function createContactsKeyboard(
   for (let i = 0; i < contacts.length; i += 3) {
     const row = contacts.slice(i, i + 3).map((contact) => ({
       text: contact.contact,
-      callback_data: `contact:select:${contact.contact}`,
+      // The ID keeps callback_data well below Telegram's 64 byte limit
+      callback_data: `contact:select:${contact.id}`,
     }));
     keyboard.push(row);
   }
@@ -263,6 +264,11 @@ function createContactsKeyboard(
   return keyboard;
 }
 
+// Characters allowed in a new contact name, & is allowed for couples/families
+const PERSON_NAME_PATTERN = /^[a-zA-ZÀ-ÿ\s'\-&]+$/;
+const PERSON_NAME_LETTER_PATTERN = /[a-zA-ZÀ-ÿ]/;
+const WHITESPACE_RUN_PATTERN = /\s+/g;
+
 /**
  * Validate person name input (supports both callbacks and text input)
  */
@@ -273,7 +279,8 @@ export const validatePersonName: InputValidator<string> = (input: string) => {
   }
 
   // For text input (new contact creation), full validation
-  const cleanInput = input.trim();
+  // Collapse repeated whitespace so the same name is always saved the same way
+  const cleanInput = input.trim().replace(WHITESPACE_RUN_PATTERN, ' ');
 
   if (cleanInput.length === 0) {
     return {
@@ -296,9 +303,7 @@ export const validatePersonName: InputValidator<string> = (input: string) => {
     };
   }
 
-  // Allow & character for couples/families
-  const validPattern = /^[a-zA-ZÀ-ÿ\s'\-&]+$/;
-  if (!validPattern.test(cleanInput)) {
+  if (!PERSON_NAME_PATTERN.test(cleanInput)) {
     return {
       valid: false,
       error:
@@ -306,8 +311,7 @@ export const validatePersonName: InputValidator<string> = (input: string) => {
     };
   }
 
-  const hasLetters = /[a-zA-ZÀ-ÿ]/.test(cleanInput);
-  if (!hasLetters) {
+  if (!PERSON_NAME_LETTER_PATTERN.test(cleanInput)) {
     return {
       valid: false,
       error: '❌ Il nome deve contenere almeno una lettera',
@@ -340,7 +344,7 @@ const presentPersonNameInput: InputPresenter = async (
 
     // Get command and category info for better user experience
     const commandType = context.session.commandType;
-    const categoryName = context.session.commandData?.category as string;
+    const categoryName = context.session.commandData?.category;
     const requiredRoles = getRequiredRoles(commandType, categoryName);
 
     const commandLabel = commandType === 'entrata'
@@ -391,6 +395,38 @@ const presentPersonNameInput: InputPresenter = async (
   }
 };
 
+/**
+ * Resolve the contact name of a contact:select callback
+ * Buttons carry the contact ID, the name is read back from the pressed
+ * button's label in the message keyboard
+ */
+function getSelectedContactName(
+  callbackQuery: TelegramCallbackQuery,
+): string | undefined {
+  const callbackData = callbackQuery.data!;
+  const selection = callbackData.replace('contact:select:', '');
+
+  // Keyboards sent before the switch to IDs carry the contact name directly
+  if (!/^\d+$/.test(selection)) {
+    return selection;
+  }
+
+  const message = callbackQuery.message;
+  const keyboard = message && 'reply_markup' in message
+    ? message.reply_markup?.inline_keyboard
+    : undefined;
+
+  for (const row of keyboard ?? []) {
+    for (const button of row) {
+      if ('callback_data' in button && button.callback_data === callbackData) {
+        return button.text;
+      }
+    }
+  }
+
+  return undefined;
+}
+
 /**
  * Handle contact selection callbacks
  */
@@ -401,7 +437,14 @@ const handlePersonNameCallback: CallbackHandler<string> = (
 
   if (callbackData.startsWith('contact:select:')) {
     // Contact selected
-    const contactName = callbackData.replace('contact:select:', '');
+    const contactName = getSelectedContactName(callbackQuery);
+    if (!contactName) {
+      return {
+        valid: false,
+        value: undefined,
+        error: 'Selezione non valida',
+      };
+    }
     return {
       valid: true,
       value: contactName,
@@ -466,7 +509,7 @@ export const updateContactsKeyboard = async (
 
     // Get command and category info for better user experience
     const commandType = context.session.commandType;
-    const categoryName = context.session.commandData?.category as string;
+    const categoryName = context.session.commandData?.category;
     const requiredRoles = getRequiredRoles(commandType, categoryName);
 
     const commandLabel = commandType === 'entrata'
@@ -574,7 +617,7 @@ export const saveNewContact = async (
   try {
     // Get command and category from session to determine roles if not provided
     const commandType = context.session.commandType;
-    const categoryName = context.session.commandData?.category as string;
+    const categoryName = context.session.commandData?.category;
 
     // If roles not provided, determine them from context
     const rolesToAssign = requiredRoles ||
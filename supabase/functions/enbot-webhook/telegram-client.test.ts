@@ -0,0 +1,58 @@
+import { assertEquals } from 'https://deno.land/std@0.208.0/assert/mod.ts';
+import { TelegramClient } from './telegram-client.ts';
+
+const client = new TelegramClient({
+  botToken: 'test-token',
+  allowedGroupId: [],
+  adminUserIds: [],
+  isDevelopment: false,
+});
+
+/**
+ * Replace fetch with a stub returning the given responses in order
+ * @returns The number of calls made so far
+ */
+function stubFetch(responses: Response[]): () => number {
+  let calls = 0;
+  globalThis.fetch = () => Promise.resolve(responses[calls++]);
+  return () => calls;
+}
+
+function rateLimited(retryAfter: number): Response {
+  return new Response(
+    JSON.stringify({
+      ok: false,
+      error_code: 429,
+      description: 'Too Many Requests',
+      parameters: { retry_after: retryAfter },
+    }),
+    { status: 429 },
+  );
+}
+
+Deno.test('TelegramClient - retries once after a short retry_after', async () => {
+  const originalFetch = globalThis.fetch;
+  const calls = stubFetch([
+    rateLimited(0),
+    new Response(JSON.stringify({ ok: true, result: true })),
+  ]);
+  try {
+    await client.deleteMessage(1, 10);
+    assertEquals(calls(), 2);
+  } finally {
+    globalThis.fetch = originalFetch;
+  }
+});
+
+Deno.test('TelegramClient - returns a long retry_after 429 as is', async () => {
+  const originalFetch = globalThis.fetch;
+  const calls = stubFetch([rateLimited(30)]);
+  try {
+    const error = await client.deleteMessage(1, 10).catch((e) => e);
+    assertEquals(error instanceof Error, true);
+    assertEquals(error.message.includes('Too Many Requests'), true);
+    assertEquals(calls(), 1);
+  } finally {
+    globalThis.fetch = originalFetch;
+  }
+});
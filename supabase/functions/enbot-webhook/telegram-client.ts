@@ -6,10 +6,20 @@ import type {
   TelegramBotCommandScope,
 } from './types.ts';
 import { validateMarkdownV2 } from './utils/markdown-utils.ts';
+import { Semaphore } from './utils/semaphore.ts';
+
+// Maximum Bot API requests in flight per client, so a burst of updates queues
+// here instead of opening an unbounded number of connections. This is a
+// concurrency cap, not a rate limit: it is per edge isolate and does not keep
+// the bot under Telegram's messages-per-second limits, 429s are handled below
+const MAX_CONCURRENT_REQUESTS = 25;
+// Longest retry_after (in seconds) worth waiting for before giving up on a 429
+const MAX_RETRY_AFTER_SECONDS = 5;
 
 export class TelegramClient {
   private botToken: string;
   private isDevelopment: boolean;
+  private requestSlots = new Semaphore(MAX_CONCURRENT_REQUESTS);
 
   constructor(config: BotConfig) {
     this.botToken = config.botToken;
@@ -27,20 +37,18 @@ export class TelegramClient {
       messageText = `🧪 [DEV MODE]\n\n${text}`;
     }
 
-    // Validate MarkdownV2 formatting if parse_mode is MarkdownV2
+    // Validate MarkdownV2 formatting in development mode to catch formatting
+    // issues early. Production messages are built from pre-escaped strings,
+    // so the per-message scan is skipped there
     const parseMode = options?.parse_mode || 'MarkdownV2';
-    if (parseMode === 'MarkdownV2') {
+    if (this.isDevelopment && parseMode === 'MarkdownV2') {
       // Only validate the original message, not the development mode prefix
-      const textToValidate = this.isDevelopment ? text : messageText;
-      const validation = validateMarkdownV2(textToValidate);
+      const validation = validateMarkdownV2(text);
       if (!validation.isValid) {
         console.warn('MarkdownV2 validation failed:', validation.errors);
-        // In development mode, throw error to catch formatting issues early
-        if (this.isDevelopment) {
-          throw new Error(
-            `MarkdownV2 validation failed: ${validation.errors.join(', ')}`,
-          );
-        }
+        throw new Error(
+          `MarkdownV2 validation failed: ${validation.errors.join(', ')}`,
+        );
       }
     }
 
@@ -52,7 +60,7 @@ export class TelegramClient {
       ...options,
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -65,6 +73,33 @@ export class TelegramClient {
     return (await response.json()).result;
   }
 
+  /**
+   * Call the Telegram Bot API
+   *
+   * Every request waits for a free slot, so at most MAX_CONCURRENT_REQUESTS
+   * are in flight. A 429 response is retried once after the retry_after delay
+   * Telegram asks for, as long as it is short.
+   */
+  private async fetchTelegram(
+    url: string,
+    init: RequestInit,
+  ): Promise<Response> {
+    const response = await this.requestSlots.run(() => fetch(url, init));
+    if (response.status !== 429) {
+      return response;
+    }
+
+    const body = await response.clone().json().catch(() => ({}));
+    const retryAfter = body?.parameters?.retry_after ?? 1;
+    if (retryAfter > MAX_RETRY_AFTER_SECONDS) {
+      return response;
+    }
+
+    console.warn(`⏳ Telegram rate limit hit, retrying in ${retryAfter}s`);
+    await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+    return await this.requestSlots.run(() => fetch(url, init));
+  }
+
   /**
    * Set bot commands menu for groups/chats
    */
@@ -79,7 +114,7 @@ export class TelegramClient {
       scope,
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -99,7 +134,7 @@ export class TelegramClient {
     const url = `https://api.telegram.org/bot${this.botToken}/deleteMyCommands`;
     const payload = scope ? { scope } : {};
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -121,7 +156,7 @@ export class TelegramClient {
     const url = `https://api.telegram.org/bot${this.botToken}/getMyCommands`;
     const payload = scope ? { scope } : {};
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -150,7 +185,7 @@ export class TelegramClient {
       menu_button: menuButton,
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -171,21 +206,18 @@ export class TelegramClient {
     text: string,
     options?: Record<string, unknown>,
   ): Promise<void> {
-    // Validate MarkdownV2 formatting if parse_mode is MarkdownV2
+    // Validate MarkdownV2 formatting in development mode only (see sendMessage)
     const parseMode = options?.parse_mode || 'MarkdownV2';
-    if (parseMode === 'MarkdownV2') {
+    if (this.isDevelopment && parseMode === 'MarkdownV2') {
       const validation = validateMarkdownV2(text);
       if (!validation.isValid) {
         console.warn(
           'MarkdownV2 validation failed for editMessage:',
           validation.errors,
         );
-        // In development mode, throw error to catch formatting issues early
-        if (this.isDevelopment) {
-          throw new Error(
-            `MarkdownV2 validation failed: ${validation.errors.join(', ')}`,
-          );
-        }
+        throw new Error(
+          `MarkdownV2 validation failed: ${validation.errors.join(', ')}`,
+        );
       }
     }
 
@@ -198,7 +230,7 @@ export class TelegramClient {
       ...options,
     };
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -234,7 +266,7 @@ export class TelegramClient {
       payload.text = text;
     }
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -253,7 +285,7 @@ export class TelegramClient {
     const url = `https://api.telegram.org/bot${this.botToken}/deleteMessage`;
     const payload = { chat_id: chatId, message_id: messageId };
 
-    const response = await fetch(url, {
+    const response = await this.fetchTelegram(url, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -279,6 +311,69 @@ export class TelegramClient {
     let failed = 0;
     const errors: string[] = [];
 
+    // Telegram accepts up to 100 message IDs in a single deleteMessages call
+    const batchSize = 100;
+    for (let i = 0; i < messageIds.length; i += batchSize) {
+      const batch = messageIds.slice(i, i + batchSize);
+
+      try {
+        await this.deleteMessageBatch(chatId, batch);
+        // Messages that no longer exist are skipped by Telegram
+        deleted += batch.length;
+        console.log(`🗑️ ${batch.length} messages deleted successfully`);
+      } catch (error) {
+        console.warn(
+          `❌ Bulk delete failed, retrying messages one by one: ${
+            error instanceof Error ? error.message : String(error)
+          }`,
+        );
+        const result = await this.deleteMessagesIndividually(chatId, batch);
+        deleted += result.deleted;
+        failed += result.failed;
+        errors.push(...result.errors);
+      }
+    }
+
+    console.log(
+      `🧹 Bulk delete completed: ${deleted} deleted, ${failed} failed`,
+    );
+
+    return { deleted, failed, errors };
+  }
+
+  /**
+   * Delete up to 100 messages with a single deleteMessages call
+   */
+  private async deleteMessageBatch(
+    chatId: number | string,
+    messageIds: number[],
+  ): Promise<void> {
+    const url = `https://api.telegram.org/bot${this.botToken}/deleteMessages`;
+    const payload = { chat_id: chatId, message_ids: messageIds };
+
+    const response = await this.fetchTelegram(url, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(payload),
+    });
+
+    if (!response.ok) {
+      const error = await response.text();
+      throw new Error(`Telegram API error: ${error}`);
+    }
+  }
+
+  /**
+   * Delete messages one at a time, used when a bulk delete is rejected
+   */
+  private async deleteMessagesIndividually(
+    chatId: number | string,
+    messageIds: number[],
+  ): Promise<{ deleted: number; failed: number; errors: string[] }> {
+    let deleted = 0;
+    let failed = 0;
+    const errors: string[] = [];
+
     // Process messages in parallel with a reasonable concurrency limit
     const batchSize = 10;
     for (let i = 0; i < messageIds.length; i += batchSize) {
@@ -307,10 +402,6 @@ export class TelegramClient {
       }
     }
 
-    console.log(
-      `🧹 Bulk delete completed: ${deleted} deleted, ${failed} failed`,
-    );
-
     return { deleted, failed, errors };
   }
 
@@ -318,9 +409,13 @@ export class TelegramClient {
     try {
       console.log(`🔗 Setting up webhook: ${webhookUrl}`);
       const url = `https://api.telegram.org/bot${this.botToken}/setWebhook`;
-      const payload = { url: webhookUrl };
+      const payload = {
+        url: webhookUrl,
+        // Only the update types the bot handles, so no invocation is wasted
+        allowed_updates: ['message', 'callback_query'],
+      };
 
-      const response = await fetch(url, {
+      const response = await this.fetchTelegram(url, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(payload),
@@ -343,7 +438,7 @@ export class TelegramClient {
       console.log('🗑️ Deleting webhook...');
       const url = `https://api.telegram.org/bot${this.botToken}/deleteWebhook`;
 
-      const response = await fetch(url, {
+      const response = await this.fetchTelegram(url, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
       });
@@ -0,0 +1,35 @@
+/**
+ * Helpers for work that should not delay the replies sent to the user
+ */
+
+/**
+ * Supabase Edge Runtime global, only present when deployed as an edge function
+ */
+interface EdgeRuntimeGlobal {
+  EdgeRuntime?: {
+    waitUntil(promise: Promise<unknown>): void;
+  };
+}
+
+/**
+ * Run a task without awaiting it
+ *
+ * On Supabase Edge Functions the task is registered with EdgeRuntime.waitUntil
+ * so the worker is kept alive until it settles. In local development (polling)
+ * the promise simply runs on its own. Failures are logged and never thrown.
+ *
+ * @param task - The already started task
+ * @param label - Short description used in the error log
+ *
+ * @example
+ * ```typescript
+ * runInBackground(this.pushToSheets(transactionId), 'Google Sheets sync');
+ * ```
+ */
+export function runInBackground(task: Promise<unknown>, label: string): void {
+  const guardedTask = task.catch((error) => {
+    console.error(`❌ Background task failed (${label}):`, error);
+  });
+
+  (globalThis as EdgeRuntimeGlobal).EdgeRuntime?.waitUntil(guardedTask);
+}
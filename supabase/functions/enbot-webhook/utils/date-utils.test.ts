@@ -0,0 +1,27 @@
+import { assertEquals } from 'https://deno.land/std@0.208.0/assert/mod.ts';
+import {
+  getCurrentMonthName,
+  getCurrentYear,
+  getMonthByNumber,
+  getMonthsArrangement,
+  getYearsArrangement,
+} from './date-utils.ts';
+
+Deno.test('getMonthByNumber - looks up months by number', () => {
+  assertEquals(getMonthByNumber('01')?.full, 'Gennaio');
+  assertEquals(getMonthByNumber('12')?.abbr, 'DIC');
+  assertEquals(getMonthByNumber('13'), undefined);
+  assertEquals(getMonthByNumber('1'), undefined);
+});
+
+Deno.test('date helpers - use the given reference date', () => {
+  const now = new Date(2025, 0, 15); // 15 January 2025
+
+  assertEquals(
+    getMonthsArrangement(now).slice(0, 2).map((month) => month.number),
+    ['12', '01'],
+  );
+  assertEquals(getYearsArrangement(now), ['2024', '2025', '2026']);
+  assertEquals(getCurrentMonthName(now), 'Gennaio');
+  assertEquals(getCurrentYear(now), '2025');
+});
@@ -34,6 +34,11 @@ export const MONTHS: MonthData[] = [
   { number: '12', abbr: 'DIC', full: 'Dicembre' },
 ];
 
+// Lookup table from month number ("01"-"12") to its data
+const MONTHS_BY_NUMBER = new Map<string, MonthData>(
+  MONTHS.map((month) => [month.number, month]),
+);
+
 /**
  * Get month data by its number (e.g., "01" for January)
  * 
@@ -48,7 +53,7 @@ export const MONTHS: MonthData[] = [
  * ```
  */
 export function getMonthByNumber(monthNumber: string): MonthData | undefined {
-  return MONTHS.find((m) => m.number === monthNumber);
+  return MONTHS_BY_NUMBER.get(monthNumber);
 }
 
 /**
@@ -74,10 +79,11 @@ export function getMonthByIndex(monthIndex: number): MonthData | undefined {
  * Get months arranged with previous month first, current month second, then others
  * Useful for UI where recent months should be prioritized
  * 
+ * @param now - Reference date (defaults to the current date)
  * @returns Array of MonthData in the arranged order
  */
-export function getMonthsArrangement(): MonthData[] {
-  const currentMonth = new Date().getMonth(); // 0-based (0 = January)
+export function getMonthsArrangement(now: Date = new Date()): MonthData[] {
+  const currentMonth = now.getMonth(); // 0-based (0 = January)
   const previousMonth = (currentMonth - 1 + 12) % 12; // Handle wrap-around for January
 
   // Start with previous month, then current, then the rest
@@ -97,10 +103,11 @@ export function getMonthsArrangement(): MonthData[] {
  * Get three years: previous, current, next
  * Useful for year selection interfaces
  * 
+ * @param now - Reference date (defaults to the current date)
  * @returns Array of year strings [previousYear, currentYear, nextYear]
  */
-export function getYearsArrangement(): string[] {
-  const currentYear = new Date().getFullYear();
+export function getYearsArrangement(now: Date = new Date()): string[] {
+  const currentYear = now.getFullYear();
   return [
     (currentYear - 1).toString(), // Previous year
     currentYear.toString(), // Current year
@@ -111,18 +118,20 @@ export function getYearsArrangement(): string[] {
 /**
  * Get current month name in Italian
  * 
+ * @param now - Reference date (defaults to the current date)
  * @returns Full name of current month
  */
-export function getCurrentMonthName(): string {
-  const currentMonth = new Date().getMonth();
+export function getCurrentMonthName(now: Date = new Date()): string {
+  const currentMonth = now.getMonth();
   return MONTHS[currentMonth].full;
 }
 
 /**
  * Get current year as string
  * 
+ * @param now - Reference date (defaults to the current date)
  * @returns Current year as string
  */
-export function getCurrentYear(): string {
-  return new Date().getFullYear().toString();
+export function getCurrentYear(now: Date = new Date()): string {
+  return now.getFullYear().toString();
 }
@@ -0,0 +1,31 @@
+import { assertEquals } from 'https://deno.land/std@0.208.0/assert/mod.ts';
+import { Semaphore } from './semaphore.ts';
+
+Deno.test('Semaphore - limits concurrent tasks', async () => {
+  const semaphore = new Semaphore(2);
+  let running = 0;
+  let maxRunning = 0;
+
+  const task = async (value: number) => {
+    running++;
+    maxRunning = Math.max(maxRunning, running);
+    await new Promise((resolve) => setTimeout(resolve, 5));
+    running--;
+    return value;
+  };
+
+  const results = await Promise.all(
+    [1, 2, 3, 4, 5].map((value) => semaphore.run(() => task(value))),
+  );
+
+  assertEquals(results, [1, 2, 3, 4, 5]);
+  assertEquals(maxRunning, 2);
+});
+
+Deno.test('Semaphore - releases the permit when a task fails', async () => {
+  const semaphore = new Semaphore(1);
+
+  await semaphore.run(() => Promise.reject(new Error('boom'))).catch(() => {});
+
+  assertEquals(await semaphore.run(() => Promise.resolve('ok')), 'ok');
+});
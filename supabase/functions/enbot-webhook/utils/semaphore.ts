@@ -0,0 +1,61 @@
+/**
+ * Counting semaphore for limiting how many async tasks run at once
+ */
+
+/**
+ * Semaphore with a fixed number of permits
+ *
+ * Tasks acquire a permit before running and release it when they settle.
+ * When no permit is free, tasks wait in FIFO order.
+ *
+ * @example
+ * ```typescript
+ * const slots = new Semaphore(25);
+ * const response = await slots.run(() => fetch(url, init));
+ * ```
+ */
+export class Semaphore {
+  private available: number;
+  private waiters: Array<() => void> = [];
+
+  constructor(permits: number) {
+    this.available = permits;
+  }
+
+  /**
+   * Wait for a free permit
+   */
+  async acquire(): Promise<void> {
+    if (this.available > 0) {
+      this.available--;
+      return;
+    }
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  /**
+   * Give a permit back, handing it directly to the next waiting task if any
+   */
+  release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.available++;
+    }
+  }
+
+  /**
+   * Run a task while holding a permit
+   * @param task - Function starting the task once a permit is acquired
+   * @returns The task result
+   */
+  async run<T>(task: () => Promise<T>): Promise<T> {
+    await this.acquire();
+    try {
+      return await task();
+    } finally {
+      this.release();
+    }
+  }
+}
@@ -0,0 +1,16 @@
+-- Migration: Stop writing session state to the WAL
+-- Purpose: Every bot interaction upserts user_sessions and inserts/updates session_messages,
+--          and each of those commits waits for a WAL flush. This state expires after 24 hours
+--          and is rebuilt by simply restarting a command, so it does not need crash durability.
+-- Affected tables: 'user_sessions', 'session_messages'
+-- Special considerations: Unlogged tables are truncated after a crash and are not replicated
+--          to read replicas. Transactions, contacts and categories stay fully logged.
+
+-- session_messages references user_sessions, and a logged table cannot reference an
+-- unlogged one, so the child table has to be switched first
+alter table public.session_messages set unlogged;
+
+alter table public.user_sessions set unlogged;
+
+comment on table public.user_sessions is 'Stores active transaction sessions for users to enable session recovery (unlogged, ephemeral)';
+comment on table public.session_messages is 'Tracks all messages (incoming and outgoing) per session for cleanup purposes (unlogged, ephemeral)';
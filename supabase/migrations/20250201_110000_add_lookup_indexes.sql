@@ -0,0 +1,21 @@
+-- Migration: Add indexes for counterparty/period lookups and last outgoing message lookups
+-- Purpose: Transactions only have single-column indexes plus a GIN index on the whole payload,
+--          which cannot serve ordered or range lookups on individual payload keys. The bot also
+--          looks up the last outgoing message of a session on every routed reply and edit.
+-- Affected tables: 'transactions', 'session_messages'
+-- Special considerations: transactions.created_at is already covered by idx_transactions_created_at,
+--          btree indexes can be scanned backwards for newest-first queries.
+--          idx_session_messages_session_id is dropped, the new composite index covers
+--          session_id lookups as its leading column
+
+-- Reports by counterparty and reference period (payload keys written by getTransactionPayload)
+create index if not exists idx_transactions_payload_family_period
+  on public.transactions ((payload->>'family'), (payload->>'year'), (payload->>'month'));
+
+-- Matches SessionManager.getLastOutgoingMessageId:
+-- where session_id = ? and message_type = 'outgoing' order by created_at desc limit 1
+create index if not exists idx_session_messages_session_type_created_at
+  on public.session_messages (session_id, message_type, created_at desc);
+
+-- session_id is the leading column of the index above, the single-column index is redundant
+drop index if exists public.idx_session_messages_session_id;
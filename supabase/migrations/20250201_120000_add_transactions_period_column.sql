@@ -0,0 +1,24 @@
+-- Migration: Add an integer reference period column to transactions
+-- Purpose: The reference period is only stored as the 'month' and 'year' text keys of the
+--          payload, so period filters have to cast and combine both keys on every row.
+--          A generated yyyymm integer (e.g. 202501) takes 4 bytes, sorts chronologically and
+--          supports btree range scans such as "between 202409 and 202506".
+-- Affected tables: 'transactions'
+-- Special considerations: The column is generated from the payload written by
+--          getTransactionPayload, so the edge function does not need to change. Adding a
+--          stored generated column rewrites the table once. Rows whose month/year are
+--          missing or not numeric (e.g. '') get null instead of failing the write.
+
+alter table public.transactions
+  add column if not exists period integer
+  generated always as (
+    case
+      when payload->>'year' ~ '^\d{4}$' and payload->>'month' ~ '^\d{2}$'
+        then (payload->>'year')::integer * 100 + (payload->>'month')::integer
+    end
+  ) stored;
+
+comment on column public.transactions.period is 'Periodo di riferimento nel formato yyyymm, derivato da payload.year e payload.month';
+
+create index if not exists idx_transactions_period
+  on public.transactions (period);
@@ -0,0 +1,22 @@
+-- Migration: Purge expired sessions on a schedule
+-- Purpose: Abandoned sessions are never deleted by the bot. They are only filtered out by
+--          expires_at on every lookup, so dead rows (and their session_messages) pile up in
+--          the tables and indexes read on each update. Deleting them in one periodic batch
+--          keeps that maintenance work off the request path.
+-- Affected tables: 'user_sessions', 'session_messages' (via on delete cascade)
+-- Special considerations: Requires the pg_cron extension (available on Supabase).
+--          cron.schedule with a job name replaces an existing job of the same name,
+--          so re-running this migration is safe.
+
+create extension if not exists pg_cron;
+
+-- Lets the purge find expired rows without scanning the whole table
+create index if not exists idx_user_sessions_expires_at
+  on public.user_sessions (expires_at);
+
+-- Same cleanup as SessionManager.cleanAllExpiredSessions, every 15 minutes
+select cron.schedule(
+  'enbot-purge-expired-sessions',
+  '*/15 * * * *',
+  $$ delete from public.user_sessions where expires_at < now() $$
+);